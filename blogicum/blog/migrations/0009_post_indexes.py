@@ -0,0 +1,23 @@
+# Written by hand: makemigrations would also pick up the unrelated drift
+# between models.py and migrations 0006-0007 (Post.image and Comment),
+# so this migration contains only the feed indexes.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0008_auto_20230801_1946'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-pub_date'], name='post_pubdate_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['category', '-pub_date'], name='post_category_pubdate_idx'),
+        ),
+    ]
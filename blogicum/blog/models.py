@@ -77,3 +77,15 @@ class Post(BaseModel):
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         ordering = ['-pub_date']
+        indexes = [
+            models.Index(
+                fields=['-pub_date'],
+                name='post_pubdate_idx',
+                condition=models.Q(is_published=True)
+            ),
+            models.Index(
+                fields=['category', '-pub_date'],
+                name='post_category_pubdate_idx',
+                condition=models.Q(is_published=True)
+            ),
+        ]
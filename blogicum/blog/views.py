@@ -1,9 +1,28 @@
-from datetime import datetime
+from functools import wraps
 
+from django.db.models.functions import Now
 from django.shortcuts import render, get_object_or_404
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
 
 from .models import Post, Category
 
+INDEX_CACHE_TIMEOUT = 60
+
+
+def cache_for_anonymous(timeout):
+    """Кэширование страницы только для анонимных пользователей"""
+    def decorator(view):
+        cached_view = cache_page(timeout)(vary_on_cookie(view))
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.user.is_authenticated:
+                return view(request, *args, **kwargs)
+            return cached_view(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
 
 def posts():
     """Получение постов из БД"""
@@ -14,19 +33,23 @@ def posts():
     ).filter(
         is_published=True,
         category__is_published=True,
-        pub_date__lte=datetime.now()
+        pub_date__lte=Now()
     )
 
 
+@cache_for_anonymous(INDEX_CACHE_TIMEOUT)
 def index(request):
     """Главная страница / Лента записей"""
-    return render(request, 'blog/index.html', {'post_list': posts()[:5]})
+    post_list = posts().defer('category__description')[:5]
+    return render(request, 'blog/index.html', {'post_list': post_list})
 
 
 def post_detail(request, id):
     """Отображение полного описания выбранной записи"""
     post = get_object_or_404(posts(), id=id)
-    return render(request, 'blog/detail.html', {'post': post})
+    context = {'post': post,
+               'can_edit': request.user.pk == post.author_id}
+    return render(request, 'blog/detail.html', context)
 
 
 def category_posts(request, category_slug):
@@ -36,6 +59,9 @@ def category_posts(request, category_slug):
         slug=category_slug,
         is_published=True
     )
+    post_list = posts().filter(
+        category=category
+    ).defer('category__description')
     context = {'category': category,
-               'post_list': posts().filter(category=category)}
+               'post_list': post_list}
     return render(request, 'blog/category.html', context)
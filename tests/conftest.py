@@ -3,6 +3,7 @@ from http import HTTPStatus
 import pytest
 from django.apps import apps
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from mixer.backend.django import mixer as _mixer
 
 try:
@@ -35,6 +36,13 @@ def mixer():
     return _mixer
 
 
+@pytest.fixture
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def user(mixer):
     User = get_user_model()
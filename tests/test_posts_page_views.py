@@ -1,5 +1,9 @@
 import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.test import RequestFactory
 
+from blog.views import cache_for_anonymous
 from tests.fixtures.fixture_data import N_TEST_POSTS, N_POSTS_LIMIT
 
 pytestmark = [
@@ -122,3 +126,32 @@ def test_many_posts_on_main_page(
         'Убедитесь, что на главной странице '
         f'отображается только {N_POSTS_LIMIT} последних публикаций.'
     )
+
+
+def _call_cached_view(users):
+    calls = []
+
+    @cache_for_anonymous(60)
+    def view(request):
+        calls.append(request)
+        return HttpResponse()
+
+    for user in users:
+        request = RequestFactory().get('/')
+        request.user = user
+        view(request)
+    return len(calls)
+
+
+def test_index_cache_for_anonymous(clear_cache):
+    assert _call_cached_view([AnonymousUser(), AnonymousUser()]) == 1, (
+        'Убедитесь, что для анонимного пользователя главная страница '
+        'отдаётся из кэша.'
+    )
+
+
+def test_index_cache_skipped_for_authenticated(clear_cache, user):
+    assert _call_cached_view([user, user]) == 2, (
+        'Убедитесь, что для авторизованного пользователя главная страница '
+        'не кэшируется.'
+    )